@@ -13,44 +13,56 @@ import httpx
 GREEN_AGENT_URL = "http://localhost:9010"
 PURPLE_AGENT_URL = "http://localhost:9011"
 
+# One shared client so all probes reuse the same keepalive pool instead of
+# paying a fresh TCP+TLS handshake per call.
+_CLIENT = httpx.AsyncClient(
+    timeout=5.0,
+    limits=httpx.Limits(
+        max_connections=256,
+        max_keepalive_connections=32,
+        keepalive_expiry=60.0,
+    ),
+)
+
 
 async def quick_test():
     """Quick test with short timeout."""
-    
+
     print("Quick smoke test...")
-    
-    # Check Green Agent
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(f"{GREEN_AGENT_URL}/.well-known/agent.json")
-            print(f"Green Agent: {resp.status_code}")
-    except Exception as e:
-        print(f"Green Agent error: {e}")
-        return
-    
-    # Check Purple Agent
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(f"{PURPLE_AGENT_URL}/.well-known/agent.json")
-            print(f"Purple Agent: {resp.status_code}")
-    except Exception as e:
-        print(f"Purple Agent error: {e}")
-        return
-    
-    print("\nBoth agents are running!")
-    
-    # Just send a simple message to Green Agent (not EvalRequest)
-    from messenger import send_message
-    
-    try:
-        outputs = await send_message(
-            message="Hello, are you the Green Agent?",
-            base_url=GREEN_AGENT_URL,
-            timeout=30
+
+    async with _CLIENT as client:
+        # Check both agents in parallel - the probes are independent, so the
+        # wall time is one RTT instead of two.
+        green_resp, purple_resp = await asyncio.gather(
+            client.get(f"{GREEN_AGENT_URL}/.well-known/agent.json"),
+            client.get(f"{PURPLE_AGENT_URL}/.well-known/agent.json"),
+            return_exceptions=True,
         )
-        print(f"\nGreen Agent response: {outputs.get('response', 'N/A')}")
-    except Exception as e:
-        print(f"\nError: {e}")
+
+        if isinstance(green_resp, Exception):
+            print(f"Green Agent error: {green_resp}")
+            return
+        print(f"Green Agent: {green_resp.status_code}")
+
+        if isinstance(purple_resp, Exception):
+            print(f"Purple Agent error: {purple_resp}")
+            return
+        print(f"Purple Agent: {purple_resp.status_code}")
+
+        print("\nBoth agents are running!")
+
+        # Just send a simple message to Green Agent (not EvalRequest)
+        from messenger import send_message
+
+        try:
+            outputs = await send_message(
+                message="Hello, are you the Green Agent?",
+                base_url=GREEN_AGENT_URL,
+                client=client
+            )
+            print(f"\nGreen Agent response: {outputs.get('response', 'N/A')}")
+        except Exception as e:
+            print(f"\nError: {e}")
 
 
 if __name__ == "__main__":
@@ -12,18 +12,22 @@ The server generates simple deterministic actions based on keywords in the input
 (e.g., "turn on living room light" -> {"action":"update","key":"living_room_light","value":"on"}).
 """
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 import uvicorn
-import uuid
-import threading
-import time
-import json
+import secrets
+import asyncio
+import functools
+import orjson
+import re
 from typing import Dict, Any
 
 app = FastAPI()
 
-# In-memory task store
+# In-memory task store (insertion-ordered; oldest entries evicted beyond the cap)
 TASKS: Dict[str, Dict[str, Any]] = {}
+_MAX_TASKS = 10_000
+
+_AC_RE = re.compile(r"set the ac to\s*(\d{2})")
 
 
 def _make_artifact_for_message(text: str) -> Dict[str, Any]:
@@ -33,86 +37,147 @@ def _make_artifact_for_message(text: str) -> Dict[str, Any]:
     # Echo text part
     parts.append({"text": f"I received: {text[:200]}"})
 
-    # Simple pattern rules
+    # Simple pattern rules; lowercase once and cache the shared scans
     text_l = text.lower()
 
+    # Fast reject: every rule below needs one of these verbs/keywords, so a
+    # miss here skips the per-rule scans and the regex entirely.
+    if "turn" not in text_l and "set" not in text_l and "ac" not in text_l:
+        parts.append({"text": orjson.dumps({"actions": []}).decode()})
+        return {"parts": parts}
+
+    has_living_room = "living room" in text_l
+
     actions = []
-    if "turn on" in text_l and "living room" in text_l:
+    if has_living_room and "turn on" in text_l:
         actions.append({"action": "update", "key": "living_room_light", "value": "on"})
-    if "turn off" in text_l and "living room" in text_l:
+    if has_living_room and "turn off" in text_l:
         actions.append({"action": "update", "key": "living_room_light", "value": "off"})
     if "ac" in text_l and "24" in text_l:
         actions.append({"action": "update", "key": "ac_temperature", "value": 24})
         actions.append({"action": "update", "key": "ac", "value": "on"})
-    if "set the ac to" in text_l:
-        # try to extract number
-        import re
-        m = re.search(r"set the ac to\s*(\d{2})", text_l)
-        if m:
-            val = int(m.group(1))
-            actions.append({"action": "update", "key": "ac_temperature", "value": val})
-            actions.append({"action": "update", "key": "ac", "value": "on"})
-
-    # Add JSON lines for actions
+    m = _AC_RE.search(text_l)
+    if m:
+        val = int(m.group(1))
+        actions.append({"action": "update", "key": "ac_temperature", "value": val})
+        actions.append({"action": "update", "key": "ac", "value": "on"})
+
+    # Add JSON lines for actions (orjson: compact output, no re-encode step)
     for act in actions:
-        parts.append({"text": json.dumps(act, ensure_ascii=False)})
+        parts.append({"text": orjson.dumps(act).decode()})
 
     # If no actions, we may return an empty actions array
     if not actions:
-        parts.append({"text": json.dumps({"actions": []}, ensure_ascii=False)})
+        parts.append({"text": orjson.dumps({"actions": []}).decode()})
 
     return {"parts": parts}
 
 
+@functools.lru_cache(maxsize=4096)
+def _artifact_json_for(text: str) -> bytes:
+    """Memoized, serialized artifact for a given input text.
+
+    The cache holds immutable bytes; callers deserialize a fresh dict so task
+    entries never share mutable artifact state.
+    """
+    return orjson.dumps(_make_artifact_for_message(text))
+
+
+async def _complete_later(task_id: str, text: str):
+    """Flip a task to completed after a short delay, on the event loop.
+
+    All TASKS mutation happens on the loop thread, so no locking is needed.
+    """
+    await asyncio.sleep(0.6)
+    task = TASKS.get(task_id)
+    if task is None:  # evicted while the completion timer was pending
+        return
+    task["status"] = {"state": "completed"}
+    task["artifacts"] = [orjson.loads(_artifact_json_for(text))]
+
+
+def _start_task(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Register a working task for one message and schedule its completion."""
+    # extract text from parts
+    text = ""
+    for p in message.get("parts", []):
+        if isinstance(p, dict) and p.get("text"):
+            text += p.get("text") + "\n"
+
+    task_id = secrets.token_hex(16)
+    session_id = secrets.token_hex(16)
+
+    # initial working state
+    TASKS[task_id] = {
+        "id": task_id,
+        "sessionId": session_id,
+        "status": {"state": "working"},
+        "artifacts": [],
+        "message_text": text,
+    }
+    # bound memory: drop the oldest task once past the cap
+    if len(TASKS) > _MAX_TASKS:
+        TASKS.pop(next(iter(TASKS)))
+
+    # schedule completion shortly (loop timer, no per-request thread)
+    asyncio.create_task(_complete_later(task_id, text))
+
+    return TASKS[task_id].copy()
+
+
+def _json_response(payload, status_code: int = 200) -> Response:
+    return Response(
+        content=orjson.dumps(payload),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 @app.post("/a2a")
 async def a2a_entry(request: Request):
-    data = await request.json()
+    data = orjson.loads(await request.body())
     method = data.get("method")
     params = data.get("params", {})
     req_id = data.get("id")
 
     if method == "tasks/send":
-        message = params.get("message", {})
-        # extract text from parts
-        text = ""
-        for p in message.get("parts", []):
-            if isinstance(p, dict) and p.get("text"):
-                text += p.get("text") + "\n"
-
-        task_id = str(uuid.uuid4())
-        session_id = str(uuid.uuid4())
-
-        # initial working state
-        TASKS[task_id] = {
-            "id": task_id,
-            "sessionId": session_id,
-            "status": {"state": "working"},
-            "artifacts": [],
-            "message_text": text,
-        }
-
-        # schedule completion shortly
-        def complete_task(tid=task_id, txt=text):
-            time.sleep(0.6)
-            TASKS[tid]["status"] = {"state": "completed"}
-            TASKS[tid]["artifacts"] = [_make_artifact_for_message(txt)]
-
-        threading.Thread(target=complete_task, daemon=True).start()
-
-        result = TASKS[task_id].copy()
+        result = _start_task(params.get("message", {}))
         # return a working status so client may poll
-        return JSONResponse({"jsonrpc": "2.0", "id": req_id, "result": result})
+        return _json_response({"jsonrpc": "2.0", "id": req_id, "result": result})
+
+    elif method == "tasks/send_many":
+        # batched variant: N messages in one round-trip, N task ids back
+        tasks = [_start_task(m) for m in params.get("messages", [])]
+        return _json_response({
+            "jsonrpc": "2.0",
+            "id": req_id,
+            "result": {"ids": [t["id"] for t in tasks], "tasks": tasks},
+        })
 
     elif method == "tasks/get":
         params_id = params.get("id")
         task = TASKS.get(params_id)
         if not task:
-            return JSONResponse({"jsonrpc": "2.0", "id": req_id, "error": "task not found"}, status_code=404)
-        return JSONResponse({"jsonrpc": "2.0", "id": req_id, "result": task})
+            return _json_response({"jsonrpc": "2.0", "id": req_id, "error": "task not found"}, status_code=404)
+        return _json_response({"jsonrpc": "2.0", "id": req_id, "result": task})
 
     else:
-        return JSONResponse({"jsonrpc": "2.0", "id": req_id, "error": "unknown method"}, status_code=400)
+        return Response(content=_ERR_UNKNOWN_METHOD, status_code=400, media_type="application/json")
+
+
+# constant error body, serialized once
+_ERR_UNKNOWN_METHOD = orjson.dumps({"jsonrpc": "2.0", "id": None, "error": "unknown method"})
 
 
 if __name__ == '__main__':
-    uvicorn.run(app, host="127.0.0.1", port=9010)
+    # uvloop + httptools are the C-implemented loop/parser; access log off
+    # removes a formatted write per request when driving load tests.
+    uvicorn.run(
+        "fake_purple_server:app",
+        host="127.0.0.1",
+        port=9010,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="warning",
+    )
@@ -4,13 +4,21 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
 import uuid
 
 GREEN_AGENT_URL = "http://127.0.0.1:9009"
 # Note: BaselineAgent internally appends "/a2a" to the URL, so we just provide the base URL
 FAKE_PURPLE_URL = "http://127.0.0.1:9010"
 
+# One session for the whole script so every request after the first reuses
+# the same keepalive connection instead of opening a new one.
+SESSION = requests.Session()
+SESSION.headers["Content-Type"] = "application/json"
+for _scheme in ("http://", "https://"):
+    SESSION.mount(_scheme, HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
 
 def main():
     print("=" * 60)
@@ -19,7 +27,7 @@ def main():
 
     # Check if servers are up
     try:
-        resp = requests.get(f"{GREEN_AGENT_URL}/.well-known/agent.json", timeout=3)
+        resp = SESSION.get(f"{GREEN_AGENT_URL}/.well-known/agent.json", timeout=3)
         print(f"[OK] Green Agent is up: {resp.status_code}")
     except Exception as e:
         print(f"[FAIL] Green Agent not reachable: {e}")
@@ -28,7 +36,7 @@ def main():
 
     try:
         # Simple health check to fake purple (use /a2a endpoint)
-        resp = requests.post(f"{FAKE_PURPLE_URL}/a2a", json={"method": "health"}, timeout=3)
+        resp = SESSION.post(f"{FAKE_PURPLE_URL}/a2a", json={"method": "health"}, timeout=3)
         print(f"[OK] Fake Purple is up: {resp.status_code}")
     except Exception as e:
         print(f"[FAIL] Fake Purple not reachable: {e}")
@@ -61,7 +69,7 @@ def main():
                 "role": "user",
                 "parts": [
                     {
-                        "text": json.dumps(eval_payload)
+                        "text": orjson.dumps(eval_payload).decode()
                     }
                 ]
             }
@@ -69,7 +77,7 @@ def main():
     }
 
     # POST to root "/" (A2A SDK convention, not "/a2a")
-    resp = requests.post(f"{GREEN_AGENT_URL}/", json=eval_request, timeout=60)
+    resp = SESSION.post(f"{GREEN_AGENT_URL}/", data=orjson.dumps(eval_request), timeout=60)
     print(f"Response status: {resp.status_code}")
     print(f"Response text: {resp.text[:500] if resp.text else '(empty)'}")
     
@@ -77,10 +85,10 @@ def main():
         print("[ERROR] Empty response from Green Agent!")
         return
         
-    result = resp.json()
+    result = orjson.loads(resp.content)
 
     print(f"\n>>> Initial Response:")
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
 
     # Check for error response
     if "error" in result:
@@ -94,16 +102,20 @@ def main():
     if task_id and task.get("status", {}).get("state") == "working":
         print("\n>>> Task is working, polling for completion...")
         import time
-        for i in range(30):  # Poll for up to 30 seconds
-            time.sleep(1)
+        # Back off exponentially from 50ms to 1s: fast first detection
+        # without hammering the server.
+        delay = 0.05
+        for i in range(60):
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
             poll_req = {
                 "jsonrpc": "2.0",
                 "id": f"poll-{i}",
                 "method": "tasks/get",
                 "params": {"id": task_id}
             }
-            resp = requests.post(f"{GREEN_AGENT_URL}/", json=poll_req, timeout=10)
-            poll_result = resp.json()
+            resp = SESSION.post(f"{GREEN_AGENT_URL}/", data=orjson.dumps(poll_req), timeout=10)
+            poll_result = orjson.loads(resp.content)
             state = poll_result.get("result", {}).get("status", {}).get("state")
             print(f"  Poll {i+1}: state={state}")
             if state in ("completed", "failed", "canceled"):
@@ -114,7 +126,7 @@ def main():
     print("\n" + "=" * 60)
     print("Final Result:")
     print("=" * 60)
-    print(json.dumps(result, indent=2, ensure_ascii=False)[:3000])
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()[:3000])
 
 
 if __name__ == "__main__":
@@ -10,11 +10,15 @@ if __name__ == "__main__":
     print("PASS RATE:", res.get('pass_rate'))
     print("CHARTS:", res.get('chart_paths'))
     print('\nDETAILED RESULTS:')
+    # build once, write once: one stdout lock/syscall instead of one per result
+    lines = []
     for r in res.get('results', []):
         try:
             # dataclass EvalResult
-            print(f"- instruction: {r.instruction[:80]} | passed: {r.passed} | score: {r.score}")
+            lines.append(f"- instruction: {r.instruction[:80]} | passed: {r.passed} | score: {r.score}")
         except Exception:
-            print(f"- {r}")
+            lines.append(f"- {r}")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
     
     print('\nReturn object keys:', list(res.keys()))
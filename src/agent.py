@@ -1,14 +1,16 @@
+import asyncio
+import functools
 import json
 import json_repair
 import logging
-from typing import Any, List, Dict
+from typing import Any, ClassVar, List, Dict
 from pydantic import BaseModel, HttpUrl, ValidationError
 from a2a.server.tasks import TaskUpdater
 from a2a.types import Message, TaskState, Part, TextPart, DataPart, FilePart
 from a2a.utils import get_message_text, new_agent_text_message
 
 from messenger import Messenger
-from green_agent_v2 import AdaptiveGenerator, WeaknessAnalyzer, TurnEvaluator, TestResult
+from green_agent_v2 import AdaptiveGenerator, WeaknessAnalyzer, TestResult, evaluate_turn
 from green_agent_v2.visualize import ReportGenerator
 from app import SmartHomeEnv
 
@@ -21,6 +23,22 @@ class EvalRequest(BaseModel):
     config: dict[str, Any]
 
 
+@functools.lru_cache(maxsize=256)
+def _validate_keys(role_keys: frozenset, config_keys: frozenset) -> tuple[bool, str]:
+    """Pure key-set validation behind an LRU cache (see Agent.validate_request)."""
+    missing_roles = Agent.required_roles - role_keys
+    if missing_roles:
+        return False, f"Missing roles: {missing_roles}"
+
+    missing_config_keys = Agent.required_config_keys - config_keys
+    if missing_config_keys:
+        return False, f"Missing config keys: {missing_config_keys}"
+
+    # Add additional request validation here
+
+    return True, "ok"
+
+
 class Agent:
     """
     Green Agent Testing Pipeline.
@@ -62,8 +80,9 @@ class Agent:
         If True, use predefined static test cases instead of LLM-generated ones.
         Useful for testing/debugging without API rate limits. Default: False.
     """
-    required_roles: list[str] = ['purple']
-    required_config_keys: list[str] = ['max_test_rounds', 'weakness_num', 'targeted_per_weakness', 'convergence_threshold']
+    required_roles: ClassVar[frozenset[str]] = frozenset(['purple'])
+    required_config_keys: ClassVar[frozenset[str]] = frozenset(
+        ['max_test_rounds', 'weakness_num', 'targeted_per_weakness', 'convergence_threshold'])
 
     def __init__(self, use_static: bool = False):
         self.messenger = Messenger()
@@ -74,19 +93,30 @@ class Agent:
         self.round_history = []
         self.all_results: List[TestResult] = []
         self._use_static = use_static
+        self._status_tasks: List[asyncio.Task] = []
 
     def validate_request(self, request: EvalRequest) -> tuple[bool, str]:
-        missing_roles = set(self.required_roles) - set(request.participants.keys())
-        if missing_roles:
-            return False, f"Missing roles: {missing_roles}"
+        # Validation only depends on which keys are present, so memoize on the
+        # key sets: repeated structurally-identical requests hit the cache.
+        return _validate_keys(
+            frozenset(request.participants), frozenset(request.config)
+        )
 
-        missing_config_keys = set(self.required_config_keys) - set(request.config.keys())
-        if missing_config_keys:
-            return False, f"Missing config keys: {missing_config_keys}"
+    def _post_status(self, updater: TaskUpdater, text: str) -> None:
+        """Publish a working-status update without blocking the eval loop.
 
-        # Add additional request validation here
+        The update runs as a background task so it overlaps with Purple I/O
+        instead of serializing with it; `_drain_status_tasks` is awaited before
+        the terminal events so every update lands first.
+        """
+        self._status_tasks.append(asyncio.create_task(
+            updater.update_status(TaskState.working, new_agent_text_message(text))
+        ))
 
-        return True, "ok"
+    async def _drain_status_tasks(self) -> None:
+        pending, self._status_tasks = self._status_tasks, []
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
     
     async def run(self, message: Message, updater: TaskUpdater) -> None:
         """
@@ -96,7 +126,14 @@ class Agent:
 
         Use self.messenger.talk_to_agent(message, url) to call other agents.
         """
-        input_text = get_message_text(message)
+        # Common case (AgentBeats requests) is a single text part: hand its
+        # payload straight to pydantic-core without get_message_text's
+        # gather-and-join pass over all parts.
+        parts = message.parts or []
+        if len(parts) == 1 and isinstance(parts[0].root, TextPart):
+            input_text = parts[0].root.text
+        else:
+            input_text = get_message_text(message)
 
         # Try to parse as EvalRequest (from AgentBeats platform)
         try:
@@ -150,10 +187,7 @@ class Agent:
             round_num = round_cnt + 1
             focus = "General Pyramid" if round_cnt == 0 else "Weakness Targeted"
             
-            # await updater.update_status(
-            #     TaskState.working, 
-            #     new_agent_text_message(f"Round {round_num}/{max_rounds}: Testing ({focus})...")
-            # ) # 这个消息会被发给purple, 错误的
+            self._post_status(updater, f"Round {round_num}/{max_rounds}: Testing ({focus})...")
             logger.info(f"Round {round_num}/{max_rounds}: Testing ({focus})...")
             
             current_round_results: List[TestResult] = []
@@ -182,7 +216,6 @@ class Agent:
                     expected_actions = turn.get('expected_agent_action', [])
                     expected_state = turn.get('expected_final_state', {})
                     
-                    evaluator = TurnEvaluator(expected_actions=expected_actions, expected_final_state=expected_state)
                     # Interaction Loop
                     current_input = instruction
                     logger.info(f"Test Case {i} / Turn {turn_id}: {instruction}")
@@ -210,7 +243,7 @@ class Agent:
                         # 2. Turn Complete
                         else:
                             # evaluate turn
-                            turn_res = evaluator.evaluate(actual_actions=self.env.get_action_history(), actual_final_state=self.env.get_state())
+                            turn_res = evaluate_turn(expected_actions, expected_state, self.env.get_action_history(), self.env.get_state())
                             break
                     
                     turn_score = turn_res['score']
@@ -267,10 +300,7 @@ class Agent:
                 all_test_cases.append(new_test_cases)
         
         # Generate final report
-        # await updater.update_status(
-        #     TaskState.working, 
-        #     new_agent_text_message("Generating assessment report...")
-        # ) 类似的把消息发给purple的问题
+        self._post_status(updater, "Generating assessment report...")
         logger.info("Generating assessment report...")
         
         report = self.report_generator.generate_report(
@@ -302,6 +332,9 @@ class Agent:
             # FilePart expects a file URI, so we'll include charts in DataPart as base64
             pass  # Charts are included in the DataPart above if needed
         
+        # make sure every in-flight status update lands before the terminal events
+        await self._drain_status_tasks()
+
         await updater.add_artifact(
             parts=artifact_parts,
             name="Assessment Result",
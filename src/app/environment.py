@@ -34,7 +34,12 @@ class SmartHomeEnv:
             "kitchen_light": ["on", "off"]
             # int 类型的约束 (ac_temperature, music_volume) 在逻辑里判断
         }
-        
+        # frozenset 版本给 update_state 热路径做 O(1) 成员检查；
+        # 有序列表保留给报错信息里的 Allowed 提示
+        self._constraint_sets = {
+            key: frozenset(values) for key, values in self.constraints.items()
+        }
+
         # 记录当前Turn的所有API请求
         self.action_history = []
 
@@ -121,14 +126,14 @@ class SmartHomeEnv:
                 "metadata": metadata
             }
 
-        # 2. 校验 Enum 类型
-        if key in self.constraints:
-            if value not in self.constraints[key]:
-                return {
-                    "status": "error",
-                    "message": f"Invalid value '{value}' for {key}. Allowed: {self.constraints[key]}",
-                    "metadata": metadata
-                }
+        # 2. 校验 Enum 类型（get 一次拿到 frozenset，成员检查只做一次哈希）
+        allowed = self._constraint_sets.get(key)
+        if allowed is not None and value not in allowed:
+            return {
+                "status": "error",
+                "message": f"Invalid value '{value}' for {key}. Allowed: {self.constraints[key]}",
+                "metadata": metadata
+            }
         
         # 3. 校验 Int 类型 (温度、音量等)
         if key in ["ac_temperature", "music_volume"]:
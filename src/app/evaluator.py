@@ -4,6 +4,8 @@
 """
 from typing import List, Dict, Any, Tuple
 
+_MISSING = object()
+
 
 class TurnEvaluator:
     """单个Turn的评分器"""
@@ -23,6 +25,8 @@ class TurnEvaluator:
         """
         self.expected_action = expected_action
         self.expected_final_state = expected_final_state
+        # 期望状态在评分器生命周期内不变，items 视图只构建一次
+        self._expected_state_items = tuple(expected_final_state.items())
     
     def evaluate(self, actual_action_sequence: List[Dict[str, Any]], actual_final_state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -86,8 +90,12 @@ class TurnEvaluator:
         Returns:
             (是否匹配, 错误列表)
         """
+        # 快速路径：通过的情况直接用一次 C 层的列表相等比较
+        if actual_sequence == self.expected_action:
+            return True, []
+
         errors = []
-        
+
         # 检查长度
         if len(actual_sequence) != len(self.expected_action):
             errors.append(
@@ -95,16 +103,16 @@ class TurnEvaluator:
                 f"got {len(actual_sequence)} actions"
             )
             return False, errors
-        
-        # 逐个检查每个请求
+
+        # 逐个检查每个请求，定位具体不一致的位置
         for i, (expected, actual) in enumerate(zip(self.expected_action, actual_sequence)):
             if expected != actual:
                 errors.append(
                     f"Action {i} mismatch: expected {expected}, got {actual}"
                 )
                 return False, errors
-        
-        return True, []
+
+        return False, errors
     
     def _verify_state(self, actual_state: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -113,21 +121,18 @@ class TurnEvaluator:
         Returns:
             (是否匹配, 错误列表)
         """
-        errors = []
-        
-        for key, expected_value in self.expected_final_state.items():
-            if key not in actual_state:
-                errors.append(f"Missing key in final state: {key}")
-                return False, errors
-            
-            actual_value = actual_state[key]
+        # 每个 key 只做一次哈希查找（get + 哨兵），而不是 in + 下标两次
+        for key, expected_value in self._expected_state_items:
+            actual_value = actual_state.get(key, _MISSING)
+            if actual_value is _MISSING:
+                return False, [f"Missing key in final state: {key}"]
+
             if actual_value != expected_value:
-                errors.append(
+                return False, [
                     f"State mismatch for '{key}': expected {expected_value}, "
                     f"got {actual_value}"
-                )
-                return False, errors
-        
+                ]
+
         return True, []
 
 
@@ -143,6 +148,14 @@ class ScenarioEvaluator:
         """
         self.scenario_data = scenario_data
         self.turns = scenario_data.get("turns", [])
+        # Turn 定义不变，评分器构建一次后跨轮复用
+        self._turn_evaluators = [
+            TurnEvaluator(
+                turn_def.get("expected_action", []),
+                turn_def.get("expected_final_state", {})
+            )
+            for turn_def in self.turns
+        ]
     
     def evaluate_all_turns(self, actual_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -179,11 +192,8 @@ class ScenarioEvaluator:
                 continue
             
             actual = actual_results[i]
-            evaluator = TurnEvaluator(
-                turn_def.get("expected_action", []),
-                turn_def.get("expected_final_state", {})
-            )
-            
+            evaluator = self._turn_evaluators[i]
+
             result = evaluator.evaluate(
                 actual.get("action_sequence", []),
                 actual.get("final_state", {})
@@ -47,6 +47,12 @@ DEVICE_CONSTRAINTS = {
     "kitchen_light": {"type": "enum", "values": ["on", "off"]},
 }
 
+# 枚举值同时提升为 frozenset：成员检查 O(1)，有序的 values 列表保留给提示词和报错信息
+for _constraint in DEVICE_CONSTRAINTS.values():
+    if _constraint["type"] == "enum":
+        _constraint["values_set"] = frozenset(_constraint["values"])
+del _constraint
+
 VALID_DEVICE_KEYS = list(DEVICE_CONSTRAINTS.keys())
 
 # 测试维度
@@ -74,7 +80,7 @@ class TestCaseValidator:
         constraint = DEVICE_CONSTRAINTS[key]
         
         if constraint["type"] == "enum":
-            if value not in constraint["values"]:
+            if value not in constraint["values_set"]:
                 return False, f"设备 '{key}' 的值 '{value}' 无效，允许值: {constraint['values']}"
         elif constraint["type"] == "int":
             if not isinstance(value, int):
@@ -1,16 +1,33 @@
-from .evaluator import TurnEvaluator, WeaknessAnalyzer
-from .instruction_generator import AdaptiveGenerator
-from .base import TestResult, WeaknessProfile, DimensionStats
-from .visualize import ReportGenerator, generate_radar_chart, generate_difficulty_bar_chart
+"""green_agent_v2 package exports.
 
-__all__ = [
-    "TurnEvaluator",
-    "WeaknessAnalyzer",
-    "AdaptiveGenerator",
-    "TestResult",
-    "WeaknessProfile",
-    "DimensionStats",
-    "ReportGenerator",
-    "generate_radar_chart",
-    "generate_difficulty_bar_chart"
-]
\ No newline at end of file
+Submodules are imported lazily (PEP 562): `visualize` pulls in matplotlib,
+which is expensive to load, so consumers that only need the evaluator or the
+data classes (e.g. smoke scripts) don't pay that import cost.
+"""
+
+_EXPORTS = {
+    "TurnEvaluator": ".evaluator",
+    "evaluate_turn": ".evaluator",
+    "evaluate_turns": ".evaluator",
+    "WeaknessAnalyzer": ".evaluator",
+    "AdaptiveGenerator": ".instruction_generator",
+    "TestResult": ".base",
+    "WeaknessProfile": ".base",
+    "DimensionStats": ".base",
+    "ReportGenerator": ".visualize",
+    "generate_radar_chart": ".visualize",
+    "generate_difficulty_bar_chart": ".visualize",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so subsequent lookups hit the module dict
+    return value
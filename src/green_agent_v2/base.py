@@ -1,9 +1,9 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """单个测试结果"""
     test_case: dict
@@ -14,7 +14,7 @@ class TestResult:
     turn_details: List[dict] = field(default_factory=list)
 
 
-@dataclass 
+@dataclass(slots=True)
 class DimensionStats:
     """维度统计"""
     total: int = 0
@@ -37,7 +37,7 @@ class DimensionStats:
         return 1.0 - self.avg_score
 
 
-@dataclass
+@dataclass(slots=True)
 class WeaknessProfile:
     """弱点画像"""
     # 按维度统计
@@ -53,12 +53,16 @@ class WeaknessProfile:
     
 
 class ExpectedAction(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     action: Literal["update"] = "update"
     key: str
     value: Any
 
 
 class Turn(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     turn_id: int
     gm_instruction: str
     expected_agent_action: List[ExpectedAction] = Field(default_factory=list)
@@ -66,6 +70,8 @@ class Turn(BaseModel):
 
 
 class TestCase(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     scenario_id: str
     difficulty: Literal["easy", "medium", "difficult"]
     dimension: str
@@ -75,5 +81,13 @@ class TestCase(BaseModel):
 
 
 class TestCaseDatabase(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    test_cases: List[TestCase] = Field(default_factory=list)
\ No newline at end of file
+    test_cases: List[TestCase] = Field(default_factory=list)
+
+
+# Parse whole databases / case lists in one pass over raw JSON bytes
+# (pydantic-core parses and validates without an intermediate json.loads).
+TEST_CASE_DB_ADAPTER = TypeAdapter(TestCaseDatabase)
+TEST_CASE_LIST_ADAPTER = TypeAdapter(List[TestCase])
\ No newline at end of file
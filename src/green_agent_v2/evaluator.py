@@ -1,3 +1,4 @@
+from collections import deque
 from typing import List, Dict, Any, Tuple, Optional, Set
 from .base import TestResult, WeaknessProfile, DimensionStats
 
@@ -5,6 +6,8 @@ from .base import TestResult, WeaknessProfile, DimensionStats
 
 DIMENSIONS = ["precision", "ambiguous", "conflict", "memory", "noise"]
 
+DIFFICULTIES = ("easy", "medium", "difficult")
+
 DEVICE_CONSTRAINTS = {
     # Living Room
     "living_room_light": {"type": "enum", "values": ["on", "off"]},
@@ -22,13 +25,119 @@ DEVICE_CONSTRAINTS = {
     "kitchen_light": {"type": "enum", "values": ["on", "off"]},
 }
 
+# Lift enum values to frozensets once at import: membership checks become a
+# single O(1) hash probe. The ordered "values" lists stay for prompts and
+# error messages, which depend on their ordering.
+for _constraint in DEVICE_CONSTRAINTS.values():
+    if _constraint["type"] == "enum":
+        _constraint["values_set"] = frozenset(_constraint["values"])
+del _constraint
+
 # --- Evaluators ---
 
+# Shared details for passing turns: same shape every time, so intern it once.
+# errors is an (immutable) empty tuple - only failure paths build fresh lists.
+_PERFECT_DETAILS = {"sequence_match": True, "state_match": True, "errors": ()}
+
+
+def evaluate_turn(
+    expected_actions: List[Dict[str, Any]],
+    expected_final_state: Dict[str, Any],
+    actual_actions: List[Dict[str, Any]],
+    actual_final_state: Dict[str, Any],
+    state_items: Optional[Tuple[Tuple[str, Any], ...]] = None,
+) -> Dict[str, Any]:
+    """
+    Pure turn evaluation: compares actual execution against expectations.
+
+    Module-level so hot loops can call it directly without allocating a
+    TurnEvaluator per turn.
+
+    Returns:
+        Dict containing score (1 or 0), status boolean, and error list.
+    """
+    # Errors stay eagerly-formatted strings: they are only built on the
+    # mismatch paths (passing turns allocate none) and every consumer embeds
+    # them verbatim in turn_details / TestResult / report artifacts.
+    errors = []
+
+    # 1. Sequence Verification
+    # Fast path: one C-level list compare covers the common passing case;
+    # the per-index diagnostics only run when the sequences differ.
+    if actual_actions != expected_actions:
+        if len(actual_actions) != len(expected_actions):
+            errors.append(f"Action count mismatch: expected {len(expected_actions)}, got {len(actual_actions)}")
+        else:
+            for i, (exp, act) in enumerate(zip(expected_actions, actual_actions)):
+                if exp != act:
+                    errors.append(f"Action #{i} mismatch: expected {exp}, got {act}")
+
+    # If sequence failed, we can return early or continue based on strictness.
+    # Here we treat sequence failure as score 0.
+    if errors:
+        return {
+            "score": 0,
+            "details": {
+                "sequence_match": False,
+                "state_match": False,
+                "errors": errors
+            },
+            "message": "Sequence mismatch"
+        }
+
+    # 2. State Verification
+    # Only verify keys present in expected_final_state; an empty expectation
+    # (action-only turn) passes outright without the loop setup.
+    if not expected_final_state:
+        return {"score": 1, "details": _PERFECT_DETAILS, "message": "Perfect"}
+
+    # reusing callers (TurnEvaluator) pass a pre-built items tuple so the
+    # dict view isn't rebuilt on every evaluation
+    state_match = True
+    for key, exp_val in (state_items if state_items is not None else expected_final_state.items()):
+        act_val = actual_final_state.get(key)
+        if act_val != exp_val:
+            errors.append(f"State mismatch [{key}]: expected '{exp_val}', got '{act_val}'")
+            state_match = False
+
+    if state_match:
+        return {"score": 1, "details": _PERFECT_DETAILS, "message": "Perfect"}
+
+    return {
+        "score": 0,
+        "details": {
+            "sequence_match": True,
+            "state_match": False,
+            "errors": errors
+        },
+        "message": "State mismatch"
+    }
+
+
+def evaluate_turns(
+    turns: List[Tuple[List[Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]], Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """
+    Batch variant of `evaluate_turn`.
+
+    Takes (expected_actions, expected_final_state, actual_actions,
+    actual_final_state) tuples and scores them in one comprehension, so N
+    turns share a single call frame's setup instead of N wrapper dispatches.
+    The result list lines up index-for-index with the input and can be fed to
+    WeaknessAnalyzer.analyze-style consumers in one go.
+    """
+    _eval = evaluate_turn
+    return [_eval(ea, es, aa, afs) for ea, es, aa, afs in turns]
+
+
 class TurnEvaluator:
     """
     Evaluates a single turn (instruction -> action -> state change).
+
+    Thin stateful wrapper around `evaluate_turn` for callers that hold the
+    expectations across multiple evaluations.
     """
-    
+
     def __init__(self, expected_actions: List[Dict[str, Any]], expected_final_state: Dict[str, Any]):
         """
         Args:
@@ -37,127 +146,115 @@ class TurnEvaluator:
         """
         self.expected_actions = expected_actions
         self.expected_final_state = expected_final_state
-    
+        # expectations are fixed for this evaluator's lifetime: snapshot the
+        # state items once so repeated evaluations walk a compact tuple
+        self._expected_state_items = tuple(expected_final_state.items())
+
     def evaluate(self, actual_actions: List[Dict[str, Any]], actual_final_state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Compares actual execution against expectations.
-        
+
         Returns:
             Dict containing score (1 or 0), status boolean, and error list.
         """
-        errors = []
-        
-        # 1. Sequence Verification
-        if len(actual_actions) != len(self.expected_actions):
-            errors.append(f"Action count mismatch: expected {len(self.expected_actions)}, got {len(actual_actions)}")
-        else:
-            for i, (exp, act) in enumerate(zip(self.expected_actions, actual_actions)):
-                if exp != act:
-                    errors.append(f"Action #{i} mismatch: expected {exp}, got {act}")
-
-        # If sequence failed, we can return early or continue based on strictness. 
-        # Here we treat sequence failure as score 0.
-        sequence_match = len(errors) == 0
-        if not sequence_match:
-             return self._build_result(0, sequence_match, False, errors, "Sequence mismatch")
-
-        # 2. State Verification
-        # Only verify keys present in expected_final_state
-        state_match = True
-        for key, exp_val in self.expected_final_state.items():
-            act_val = actual_final_state.get(key)
-            if act_val != exp_val:
-                errors.append(f"State mismatch [{key}]: expected '{exp_val}', got '{act_val}'")
-                state_match = False
-        
-        score = 1 if state_match else 0
-        message = "Perfect" if score == 1 else "State mismatch"
-        
-        return self._build_result(score, sequence_match, state_match, errors, message)
-
-    def _build_result(self, score: int, seq_match: bool, state_match: bool, errors: List[str], msg: str) -> Dict[str, Any]:
-        """Helper to construct the return dictionary."""
-        return {
-            "score": score,
-            "details": {
-                "sequence_match": seq_match,
-                "state_match": state_match,
-                "errors": errors
-            },
-            "message": msg
-        }
+        return evaluate_turn(
+            self.expected_actions, self.expected_final_state,
+            actual_actions, actual_final_state,
+            state_items=self._expected_state_items,
+        )
 
 
 class WeaknessAnalyzer:
     """弱点分析器"""
     
-    def __init__(self):
+    def __init__(self, failed_case_cap: int = 10_000):
         self.profile = WeaknessProfile()
-        # 初始化各维度统计
-        for dim in DIMENSIONS:
-            self.profile.by_dimension[dim] = DimensionStats()
-        for diff in ['easy', 'medium', 'difficult']:
-            self.profile.by_difficulty[diff] = DimensionStats()
-        for device in DEVICE_CONSTRAINTS.keys():
-            self.profile.by_device[device] = DimensionStats()
+        # 初始化各维度统计（字典推导式一次建好，容器尺寸一步到位）
+        self.profile.by_dimension = {dim: DimensionStats() for dim in DIMENSIONS}
+        self.profile.by_difficulty = {diff: DimensionStats() for diff in DIFFICULTIES}
+        self.profile.by_device = {device: DimensionStats() for device in DEVICE_CONSTRAINTS}
+        # 失败用例用有界 deque：聚合统计已经在上面的 stats 里，这里只需
+        # 保留最近的失败样本，长跑时内存有上界，append 也不触发列表扩容
+        self.profile.failed_cases = deque(maxlen=failed_case_cap)
+        # 容器直接挂在 analyzer 上（与 profile 共享引用）：
+        # 热路径一跳属性访问，不必每次都经过 self.profile
+        self._by_dim = self.profile.by_dimension
+        self._by_diff = self.profile.by_difficulty
+        self._by_dev = self.profile.by_device
+        self._failed_cases = self.profile.failed_cases
     
     def analyze(self, results: List[TestResult]) -> WeaknessProfile:
         """分析测试结果，更新弱点画像"""
-        
+
+        # 热循环里把容器绑定到局部变量（LOAD_FAST 而非逐次 LOAD_ATTR）
+        by_dimension = self._by_dim
+        by_difficulty = self._by_diff
+        by_device = self._by_dev
+        failed_cases = self._failed_cases
+
         for result in results:
             case = result.test_case
             dimension = case.get('dimension', 'unknown')
             difficulty = case.get('difficulty', 'unknown')
-            
-            # 更新维度统计
-            if dimension in self.profile.by_dimension:
-                self._update_stats(self.profile.by_dimension[dimension], result)
-            
-            # 更新难度统计
-            if difficulty in self.profile.by_difficulty:
-                self._update_stats(self.profile.by_difficulty[difficulty], result)
-            
-            # 更新设备统计
-            devices_involved = self._extract_devices(case)
-            for device in devices_involved:
-                if device in self.profile.by_device:
-                    self._update_stats(self.profile.by_device[device], result)
-            
+
+            # 先收集本条结果要更新的所有 DimensionStats（维度/难度/各设备），
+            # 增量只算一次，再用一个紧凑循环统一写入
+            targets = []
+            stats = by_dimension.get(dimension)
+            if stats is not None:
+                targets.append(stats)
+            stats = by_difficulty.get(difficulty)
+            if stats is not None:
+                targets.append(stats)
+            # 设备几乎总在 DEVICE_CONSTRAINTS 里，EAFP 免去预判
+            for device in self._extract_devices(case):
+                try:
+                    targets.append(by_device[device])
+                except KeyError:
+                    continue
+
+            score = result.score
+            max_score = result.max_score
+            passed = result.passed
+            inc_pass = 1 if passed else 0
+            inc_fail = 1 - inc_pass
+            for stats in targets:
+                stats.total += 1
+                stats.total_score += score
+                # max_possible_score 按用例的 turn 数累加（multi-turn 用例 > 1），
+                # 与 total（用例数）并不同步，不能互相推导
+                stats.max_possible_score += max_score
+                stats.passed += inc_pass
+                stats.failed += inc_fail
+
             # 记录失败用例
-            if not result.passed:
-                self.profile.failed_cases.append(result)
+            if not passed:
+                failed_cases.append(result)
         
         # 检测能力边界
         self._detect_boundaries()
         
         return self.profile
     
-    def _update_stats(self, stats: DimensionStats, result: TestResult):
-        """更新统计数据"""
-        stats.total += 1
-        stats.total_score += result.score
-        stats.max_possible_score += result.max_score
-        if result.passed:
-            stats.passed += 1
-        else:
-            stats.failed += 1
-    
-    def _extract_devices(self, case: dict) -> set:
-        """提取涉及的设备"""
-        devices = set()
-        
-        # 从 initial_state
-        for key in case.get('initial_state', {}).keys():
-            devices.add(key)
-        
+    def _extract_devices(self, case: dict) -> frozenset:
+        """提取涉及的设备（结果写回 case 本身，返回不可变集合）"""
+        # 记忆化只按 case 字典本身：scenario_id 是 LLM 按编码体系生成的标签
+        # （如 scenario_A1_B1_C0_N0），不同用例经常重名，不能当缓存键。
+        # 同一真值用例跨轮复用时就是同一个字典对象，写回已经覆盖该场景。
+        devices = case.get('involved_devices')
+        if devices is not None:
+            return devices
+
+        # 从 initial_state；|= 直接吃 keys 视图，整段在 C 层合并
+        devices = set(case.get('initial_state', {}))
+
         # 从 turns
         for turn in case.get('turns', []):
-            for action in turn.get('expected_agent_action', []):
-                if 'key' in action:
-                    devices.add(action['key'])
-            for key in turn.get('expected_final_state', {}).keys():
-                devices.add(key)
-        
+            devices |= {action['key'] for action in turn.get('expected_agent_action', []) if 'key' in action}
+            devices |= turn.get('expected_final_state', {}).keys()
+
+        devices = frozenset(devices)
+        case['involved_devices'] = devices
         return devices
     
     def _detect_boundaries(self):
@@ -247,10 +344,10 @@ class WeaknessAnalyzer:
 #         # }
         
 #         # 2. Enrich result with metadata for the record
-#         full_record = {
-#             **result,
-#             "index": len(self.history)
-#         }
+#         # (copy + assignment beats a {**result, ...} splat merge for small dicts)
+#         full_record = dict(result)
+#         full_record["metadata"] = metadata
+#         full_record["index"] = len(self.history)
 #         self.history.append(full_record)
         
 #         # 3. Synchronize global performance (Update Weakness Analyzer)
@@ -9,6 +9,7 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 
 from .prompts import SYSTEM_PROMPT, USER_PROMPT, difficulty_specs, dimension_specs
 from .base import TestCase
+from .evaluator import DIFFICULTIES
 
 load_dotenv()
 
@@ -263,18 +264,16 @@ class AdaptiveGenerator:
             
             print(f"  🎯 Targeting weakness [{weakness_type}: {weakness_name}] | Base difficulty: {base_difficulty}")
             
-            difficulties_order = ['easy', 'medium', 'difficult']
-            
             for i in range(count_per_weakness):
                 current_difficulty = base_difficulty
                 
                 # Logic to boost difficulty progressively
                 if difficulty_boost and i > 0:
                     try:
-                        idx = difficulties_order.index(base_difficulty)
+                        idx = DIFFICULTIES.index(base_difficulty)
                         # Every 2 cases, try to increase difficulty
-                        if i >= 2 and idx < len(difficulties_order) - 1:
-                            current_difficulty = difficulties_order[idx + 1]
+                        if i >= 2 and idx < len(DIFFICULTIES) - 1:
+                            current_difficulty = DIFFICULTIES[idx + 1]
                     except ValueError:
                         pass
 
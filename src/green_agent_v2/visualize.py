@@ -4,6 +4,8 @@
 使用 matplotlib 生成多维能力雷达图和评估报告
 """
 
+import dataclasses
+import itertools
 import json
 import math
 import io
@@ -11,6 +13,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any, TYPE_CHECKING
 
+from .evaluator import DIFFICULTIES
+
 if TYPE_CHECKING:
     from .base import WeaknessProfile, TestResult, DimensionStats
 
@@ -131,7 +135,7 @@ def generate_difficulty_bar_chart(
     if not HAS_MATPLOTLIB or plt is None or np is None or mpatches is None:
         return None
     
-    difficulties = ['easy', 'medium', 'difficult']
+    difficulties = DIFFICULTIES
     pass_rates = []
     totals = []
     
@@ -292,7 +296,8 @@ class ReportGenerator:
                 for diff, stats in profile.by_difficulty.items()
             },
             "boundaries": profile.boundary_found,
-            "top_weaknesses": profile.failed_cases[:10] if profile.failed_cases else [],
+            # islice 而不是切片：failed_cases 是 deque（不支持切片）
+            "top_weaknesses": list(itertools.islice(profile.failed_cases, 10)),
             "round_history": round_history
         }
         
@@ -365,7 +370,7 @@ class ReportGenerator:
         lines.append(f"| Difficulty | Tests | Pass Rate |")
         lines.append(f"|------------|-------|-----------|")
         
-        for diff in ['easy', 'medium', 'difficult']:
+        for diff in DIFFICULTIES:
             stats = profile.by_difficulty.get(diff)
             if stats and stats.total > 0:
                 lines.append(f"| {diff.capitalize()} | {stats.total} | {stats.pass_rate*100:.1f}% |")
@@ -431,10 +436,15 @@ class ReportGenerator:
         """清理数据以便 JSON 序列化"""
         if isinstance(data, dict):
             return {k: self._clean_for_json(v) for k, v in data.items()}
-        elif isinstance(data, list):
+        elif isinstance(data, (list, tuple, set, frozenset)):
             return [self._clean_for_json(item) for item in data]
+        elif dataclasses.is_dataclass(data) and not isinstance(data, type):
+            # Works for slotted dataclasses too (they have no __dict__)
+            return self._clean_for_json(
+                {f.name: getattr(data, f.name) for f in dataclasses.fields(data)}
+            )
         elif hasattr(data, '__dict__'):
-            # Convert dataclass/object to dict
+            # Convert plain object to dict
             return self._clean_for_json(vars(data))
         elif isinstance(data, (int, float, str, bool, type(None))):
             return data
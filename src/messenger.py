@@ -49,47 +49,69 @@ async def send_message(
     streaming: bool = False,
     timeout: int = DEFAULT_TIMEOUT,
     consumer: Consumer | None = None,
+    client: httpx.AsyncClient | None = None,
 ):
-    """Returns dict with context_id, response and status (if exists)"""
+    """Returns dict with context_id, response and status (if exists)
+
+    If `client` is given, its connection pool is reused and left open for the
+    caller; otherwise a one-shot client is created for this call.
+    """
+    if client is not None:
+        return await _send_message_with_client(
+            client, message, base_url, context_id, streaming, consumer
+        )
     async with httpx.AsyncClient(timeout=timeout) as httpx_client:
-        resolver = A2ACardResolver(httpx_client=httpx_client, base_url=base_url)
-        agent_card = await resolver.get_agent_card()
-        config = ClientConfig(
-            httpx_client=httpx_client,
-            streaming=streaming,
+        return await _send_message_with_client(
+            httpx_client, message, base_url, context_id, streaming, consumer
         )
-        factory = ClientFactory(config)
-        client = factory.create(agent_card)
-        if consumer:
-            await client.add_event_consumer(consumer)
-
-        outbound_msg = create_message(text=message, context_id=context_id)
-        last_event = None
-        outputs = {"response": "", "context_id": None}
-
-        # if streaming == False, only one event is generated
-        async for event in client.send_message(outbound_msg):
-            last_event = event
-
-        match last_event:
-            case Message() as msg:
-                outputs["context_id"] = msg.context_id
-                outputs["response"] += merge_parts(msg.parts)
 
-            case (task, update):
-                outputs["context_id"] = task.context_id
-                outputs["status"] = task.status.state.value
-                msg = task.status.message
-                if msg:
-                    outputs["response"] += merge_parts(msg.parts)
-                if task.artifacts:
-                    for artifact in task.artifacts:
-                        outputs["response"] += merge_parts(artifact.parts)
 
-            case _:
-                pass
+async def _send_message_with_client(
+    httpx_client: httpx.AsyncClient,
+    message: str,
+    base_url: str,
+    context_id: str | None,
+    streaming: bool,
+    consumer: Consumer | None,
+):
+    resolver = A2ACardResolver(httpx_client=httpx_client, base_url=base_url)
+    agent_card = await resolver.get_agent_card()
+    config = ClientConfig(
+        httpx_client=httpx_client,
+        streaming=streaming,
+    )
+    factory = ClientFactory(config)
+    client = factory.create(agent_card)
+    if consumer:
+        await client.add_event_consumer(consumer)
+
+    outbound_msg = create_message(text=message, context_id=context_id)
+    last_event = None
+    outputs = {"response": "", "context_id": None}
+
+    # if streaming == False, only one event is generated
+    async for event in client.send_message(outbound_msg):
+        last_event = event
+
+    match last_event:
+        case Message() as msg:
+            outputs["context_id"] = msg.context_id
+            outputs["response"] += merge_parts(msg.parts)
+
+        case (task, update):
+            outputs["context_id"] = task.context_id
+            outputs["status"] = task.status.state.value
+            msg = task.status.message
+            if msg:
+                outputs["response"] += merge_parts(msg.parts)
+            if task.artifacts:
+                for artifact in task.artifacts:
+                    outputs["response"] += merge_parts(artifact.parts)
+
+        case _:
+            pass
 
-        return outputs
+    return outputs
 
 
 class Messenger: